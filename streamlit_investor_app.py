@@ -8,9 +8,11 @@ import streamlit as st
 import pandas as pd
 import numpy as np
 import plotly.graph_objects as go
-import plotly.express as px
-from datetime import datetime, timedelta
-import base64
+import plotly.io as pio
+from pathlib import Path
+
+# Serialize chart JSON with orjson (native numpy support, much faster than stdlib json)
+pio.json.config.default_engine = "orjson"
 
 # Page configuration
 st.set_page_config(
@@ -21,118 +23,63 @@ st.set_page_config(
 )
 
 # Custom CSS for professional styling
-st.markdown("""
-<style>
-    .main-header {
-        background: linear-gradient(135deg, #1a365d 0%, #2d3748 100%);
-        color: white;
-        padding: 2rem;
-        border-radius: 10px;
-        text-align: center;
-        margin-bottom: 2rem;
-        box-shadow: 0 10px 30px rgba(0, 0, 0, 0.2);
-    }
-    
-    .metric-card {
-        background: linear-gradient(135deg, #38a169 0%, #48bb78 100%);
-        color: white;
-        padding: 1.5rem;
-        border-radius: 10px;
-        text-align: center;
-        box-shadow: 0 5px 15px rgba(56, 161, 105, 0.3);
-        margin-bottom: 1rem;
-    }
-    
-    .feature-card {
-        background: white;
-        border: 1px solid #e2e8f0;
-        border-left: 5px solid #38a169;
-        padding: 1.5rem;
-        border-radius: 8px;
-        box-shadow: 0 2px 10px rgba(0, 0, 0, 0.1);
-        margin-bottom: 1rem;
-    }
-    
-    .highlight-box {
-        background: linear-gradient(135deg, #1a365d 0%, #2d3748 100%);
-        color: white;
-        padding: 2rem;
-        border-radius: 15px;
-        text-align: center;
-        margin: 2rem 0;
-    }
-    
-    .advantages-list {
-        list-style: none;
-        padding: 0;
-    }
-    
-    .advantages-list li {
-        padding: 0.5rem 0;
-        padding-left: 1.5rem;
-        position: relative;
-        color: white;
-    }
-    
-    .advantages-list li::before {
-        content: "✓";
-        position: absolute;
-        left: 0;
-        color: #38a169;
-        font-weight: bold;
-        font-size: 1.2rem;
-    }
-    
-    .comparison-table {
-        background: white;
-        border-radius: 8px;
-        overflow: hidden;
-        box-shadow: 0 2px 10px rgba(0, 0, 0, 0.1);
-    }
-    
-    .confidential-footer {
-        background: #1a365d;
-        color: white;
-        text-align: center;
-        padding: 1.5rem;
-        border-radius: 8px;
-        margin-top: 2rem;
-    }
-</style>
-""", unsafe_allow_html=True)
+CSS_PATH = Path(__file__).parent / 'assets' / 'styles.css'
+
+@st.cache_data(show_spinner=False)
+def _load_css():
+    """Read the stylesheet once per process"""
+    return CSS_PATH.read_text(encoding='utf-8')
+
+st.markdown(f"<style>{_load_css()}</style>", unsafe_allow_html=True)
 
+# Business-day axis for the performance curves, computed once at import
+_DATES = pd.bdate_range('2025-09-01', periods=48).to_numpy()
+
+@st.cache_data(ttl=None, show_spinner=False)
 def generate_performance_data():
     """Generate realistic performance data for charts"""
-    np.random.seed(42)
-    dates = pd.date_range('2025-09-01', '2025-11-11', freq='B')[:48]
-    
-    # Generate cumulative performance curves
-    our_algorithm = np.cumsum(np.random.normal(2593, 1500, 48))
-    our_algorithm = our_algorithm / our_algorithm[-1] * 124477
+    rng = np.random.default_rng(42)
     
-    bank_nifty = np.cumsum(np.random.normal(390, 600, 48))
-    bank_nifty = bank_nifty / bank_nifty[-1] * 18750
+    # Generate cumulative performance curves (one row per strategy)
+    mus = np.array([2593, 390, 260, 173])[:, None]
+    sigmas = np.array([1500, 600, 400, 250])[:, None]
+    finals = np.array([124477, 18750, 12500, 8333])[:, None]
     
-    nifty_index = np.cumsum(np.random.normal(260, 400, 48))
-    nifty_index = nifty_index / nifty_index[-1] * 12500
+    draws = rng.standard_normal((4, 48)) * sigmas + mus
+    cum = draws.cumsum(axis=1)
+    cum = cum / cum[:, -1:] * finals
+    our_algorithm, bank_nifty, nifty_index, mutual_funds = cum
     
-    mutual_funds = np.cumsum(np.random.normal(173, 250, 48))
-    mutual_funds = mutual_funds / mutual_funds[-1] * 8333
-    
-    return pd.DataFrame({
-        'Date': dates,
+    df = pd.DataFrame({
+        'Date': _DATES,
         'Our_Algorithm': our_algorithm,
         'Bank_Nifty': bank_nifty,
         'Nifty_Index': nifty_index,
         'Mutual_Funds': mutual_funds
     })
+    
+    # float32 is ample precision for rupee-scale chart values and halves the payload
+    value_cols = ['Our_Algorithm', 'Bank_Nifty', 'Nifty_Index', 'Mutual_Funds']
+    df[value_cols] = df[value_cols].astype(np.float32)
+    
+    return df
+
+# Layout fields shared by every chart; each constructor only sets its own deltas
+_BASE_LAYOUT = go.Layout(
+    template='plotly_white',
+    margin=dict(l=40, r=20, t=50, b=40)
+)
 
-def create_performance_chart(data):
+@st.cache_resource
+def create_performance_chart():
     """Create interactive performance comparison chart"""
-    fig = go.Figure()
+    data = generate_performance_data()
+    dates = data['Date'].to_numpy()
+    fig = go.Figure(layout=_BASE_LAYOUT)
     
-    fig.add_trace(go.Scatter(
-        x=data['Date'], y=data['Our_Algorithm'],
+    # numpy float32 y-values are shipped to the browser as base64 typed arrays
+    fig.add_trace(go.Scattergl(
+        x=dates, y=data['Our_Algorithm'].to_numpy(),
         mode='lines+markers',
         name='Our Algorithm',
         line=dict(color='#38a169', width=4),
@@ -140,22 +87,22 @@ def create_performance_chart(data):
         fillcolor='rgba(56, 161, 105, 0.1)'
     ))
     
-    fig.add_trace(go.Scatter(
-        x=data['Date'], y=data['Bank_Nifty'],
+    fig.add_trace(go.Scattergl(
+        x=dates, y=data['Bank_Nifty'].to_numpy(),
         mode='lines',
         name='Bank Nifty',
         line=dict(color='#ed8936', width=2, dash='dash')
     ))
     
-    fig.add_trace(go.Scatter(
-        x=data['Date'], y=data['Nifty_Index'],
+    fig.add_trace(go.Scattergl(
+        x=dates, y=data['Nifty_Index'].to_numpy(),
         mode='lines',
         name='Nifty Index',
         line=dict(color='#3182ce', width=2, dash='dash')
     ))
     
-    fig.add_trace(go.Scatter(
-        x=data['Date'], y=data['Mutual_Funds'],
+    fig.add_trace(go.Scattergl(
+        x=dates, y=data['Mutual_Funds'].to_numpy(),
         mode='lines',
         name='Mutual Funds',
         line=dict(color='#9f7aea', width=2, dash='dash')
@@ -166,12 +113,12 @@ def create_performance_chart(data):
         xaxis_title='Date',
         yaxis_title='Cumulative Returns (₹)',
         hovermode='x unified',
-        template='plotly_white',
         height=500
     )
     
     return fig
 
+@st.cache_resource
 def create_drawdown_chart():
     """Create drawdown comparison chart"""
     strategies = ['Our Algorithm', 'Bank Nifty', 'Nifty Index', 'Mutual Funds']
@@ -180,24 +127,24 @@ def create_drawdown_chart():
     
     fig = go.Figure(data=[
         go.Bar(x=strategies, y=drawdowns, marker_color=colors)
-    ])
+    ], layout=_BASE_LAYOUT)
     
     fig.update_layout(
         title='Maximum Drawdown Comparison',
         xaxis_title='Strategy',
         yaxis_title='Drawdown (%)',
-        template='plotly_white',
         height=400
     )
     
     return fig
 
+@st.cache_resource
 def create_risk_radar_chart():
     """Create risk profile radar chart"""
     categories = ['Consistency', 'Drawdown Control', 'Win Rate', 'Sharpe Ratio', 'Adaptability']
     values = [85, 90, 75, 85, 95]
     
-    fig = go.Figure()
+    fig = go.Figure(layout=_BASE_LAYOUT)
     
     fig.add_trace(go.Scatterpolar(
         r=values,
@@ -216,12 +163,156 @@ def create_risk_radar_chart():
             )),
         showlegend=False,
         title='Risk Profile Assessment',
-        template='plotly_white',
         height=400
     )
     
     return fig
 
+def _metric_card(value, label, caption):
+    """Render a single headline metric card"""
+    return (
+        '<div class="metric-card">'
+        f'<div style="font-size: 2rem; font-weight: bold;">{value}</div>'
+        f'<div>{label}</div>'
+        f'<div style="font-size: 0.9rem; opacity: 0.9;">{caption}</div>'
+        '</div>'
+    )
+
+def _feature_card(title, body, heading='h4'):
+    """Render a single feature card"""
+    return (
+        '<div class="feature-card">'
+        f'<{heading}>{title}</{heading}>'
+        f'<p>{body}</p>'
+        '</div>'
+    )
+
+def _grid(cards, columns):
+    """Lay out pre-rendered cards in a CSS grid, filled row by row"""
+    return f'<div class="grid-{columns}">' + ''.join(cards) + '</div>'
+
+# Static HTML sections, built once at import and emitted with one st.markdown each
+METRICS_HTML = _grid([
+    _metric_card('₹124,477', 'Total Returns', '2.5 Months'),
+    _metric_card('62.5%', 'Win Rate', 'Controlled Risk'),
+    _metric_card('186.8%', 'Annualized Return', 'Risk-Adjusted'),
+    _metric_card('4.20', 'Sharpe Ratio', 'Exceptional'),
+], 4)
+
+FEATURE_CARDS_HTML = _grid([
+    _feature_card(
+        '🧠 Advanced Pattern Recognition',
+        'Machine learning algorithms analyze historical market patterns and identify optimal options trading opportunities with precision timing.'
+    ),
+    _feature_card(
+        '⚙️ Systematic Execution',
+        'Fully automated options strategy eliminates emotional bias and ensures consistent implementation of complex hedged positions.'
+    ),
+    _feature_card(
+        '🛡️ Options Hedging Protection',
+        'Strategic options positions create natural hedges against market volatility, protecting capital during adverse movements while capturing upside potential.'
+    ),
+    _feature_card(
+        '📊 Multi-Index Options Selection',
+        'Intelligent selection across Nifty and Sensex options with correlation-based hedging for enhanced risk-adjusted returns.'
+    ),
+], 2)
+
+RISK_CARDS_HTML = _grid([
+    _feature_card(
+        'Options Hedging Protection',
+        'Strategic options positions provide natural insurance against adverse market movements',
+        heading='h5'
+    ),
+    _feature_card(
+        'Dynamic Delta Management',
+        'Real-time adjustment of position delta to maintain optimal risk-reward profile',
+        heading='h5'
+    ),
+    _feature_card(
+        'Correlation Hedging',
+        'Multi-index options selection reduces single-market dependency through diversification',
+        heading='h5'
+    ),
+    _feature_card(
+        'Volatility Shield',
+        'Hedged positions benefit from volatility spikes while limiting downside exposure',
+        heading='h5'
+    ),
+    _feature_card(
+        'Time Decay Optimization',
+        'Strategic use of options theta decay to generate income while maintaining protection',
+        heading='h5'
+    ),
+    _feature_card(
+        'Tail Risk Protection',
+        'Options structure provides asymmetric payoff protecting against extreme market events',
+        heading='h5'
+    ),
+], 3)
+
+TERMS_CARDS_HTML = _grid([
+    _feature_card(
+        '🎯 PERFORMANCE TARGETS',
+        'Annual Returns: 40-60%<br>Win Rate: 60-65%<br>Max Drawdown: &lt;25%<br>Sharpe Ratio: &gt;3.0',
+        heading='h5'
+    ),
+    _feature_card(
+        '📊 OPERATIONAL EXCELLENCE',
+        'Daily monitoring &amp; execution<br>Real-time risk management<br>Monthly performance reporting<br>Quarterly optimization reviews',
+        heading='h5'
+    ),
+    _feature_card(
+        '💼 INVESTMENT TERMS',
+        'Minimum Investment: As per discussion<br>Management Fee: Competitive rates<br>Performance Fee: Success aligned<br>Scalable structure',
+        heading='h5'
+    ),
+    _feature_card(
+        '🚀 COMPETITIVE EDGE',
+        'Proprietary &amp; proven algorithm<br>Fully systematic execution<br>Various allocation sizes<br>Continuous optimization',
+        heading='h5'
+    ),
+], 2)
+
+comparison_data = {
+    'Metric': ['Total Returns', 'Annualized Return', 'Daily Average', 'Win Rate', 'Sharpe Ratio'],
+    'Our Algorithm': ['₹124,477', '186.8%', '₹2,593', '62.5%', '4.20'],
+    'Best Traditional': ['₹18,750', '28.1%', '₹390', '52.0%', '0.9'],
+    'Outperformance': ['+564%', '+565%', '+565%', '+20%', '+367%']
+}
+
+def _comparison_table(data):
+    """Render a dict of columns as a static HTML table"""
+    header = ''.join(f'<th>{col}</th>' for col in data)
+    rows = ''.join(
+        '<tr>' + ''.join(f'<td>{cell}</td>' for cell in row) + '</tr>'
+        for row in zip(*data.values())
+    )
+    return (
+        '<div class="comparison-table">'
+        f'<table style="width: 100%;"><thead><tr>{header}</tr></thead>'
+        f'<tbody>{rows}</tbody></table>'
+        '</div>'
+    )
+
+COMPARISON_TABLE_HTML = _comparison_table(comparison_data)
+
+@st.fragment
+def _performance_chart_section():
+    """Render the performance chart; reruns independently of the rest of the page"""
+    st.plotly_chart(create_performance_chart(), use_container_width=True)
+
+@st.fragment
+def _risk_charts_section():
+    """Render the drawdown and risk radar charts side by side"""
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.plotly_chart(create_drawdown_chart(), use_container_width=True)
+    
+    with col2:
+        st.plotly_chart(create_risk_radar_chart(), use_container_width=True)
+
 def main():
     """Main Streamlit app"""
     
@@ -238,43 +329,7 @@ def main():
     """, unsafe_allow_html=True)
     
     # Key Metrics
-    col1, col2, col3, col4 = st.columns(4)
-    
-    with col1:
-        st.markdown("""
-        <div class="metric-card">
-            <div style="font-size: 2rem; font-weight: bold;">₹124,477</div>
-            <div>Total Returns</div>
-            <div style="font-size: 0.9rem; opacity: 0.9;">2.5 Months</div>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col2:
-        st.markdown("""
-        <div class="metric-card">
-            <div style="font-size: 2rem; font-weight: bold;">62.5%</div>
-            <div>Win Rate</div>
-            <div style="font-size: 0.9rem; opacity: 0.9;">Controlled Risk</div>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col3:
-        st.markdown("""
-        <div class="metric-card">
-            <div style="font-size: 2rem; font-weight: bold;">186.8%</div>
-            <div>Annualized Return</div>
-            <div style="font-size: 0.9rem; opacity: 0.9;">Risk-Adjusted</div>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col4:
-        st.markdown("""
-        <div class="metric-card">
-            <div style="font-size: 2rem; font-weight: bold;">4.20</div>
-            <div>Sharpe Ratio</div>
-            <div style="font-size: 0.9rem; opacity: 0.9;">Exceptional</div>
-        </div>
-        """, unsafe_allow_html=True)
+    st.markdown(METRICS_HTML, unsafe_allow_html=True)
     
     st.markdown("---")
     
@@ -283,21 +338,11 @@ def main():
     st.subheader("Systematic outperformance across all metrics")
     
     # Generate and display performance chart
-    performance_data = generate_performance_data()
-    performance_fig = create_performance_chart(performance_data)
-    st.plotly_chart(performance_fig, use_container_width=True)
+    _performance_chart_section()
     
     # Comparison Table
     st.subheader("Performance Comparison")
-    comparison_data = {
-        'Metric': ['Total Returns', 'Annualized Return', 'Daily Average', 'Win Rate', 'Sharpe Ratio'],
-        'Our Algorithm': ['₹124,477', '186.8%', '₹2,593', '62.5%', '4.20'],
-        'Best Traditional': ['₹18,750', '28.1%', '₹390', '52.0%', '0.9'],
-        'Outperformance': ['+564%', '+565%', '+565%', '+20%', '+367%']
-    }
-    
-    df = pd.DataFrame(comparison_data)
-    st.dataframe(df, use_container_width=True, hide_index=True)
+    st.markdown(COMPARISON_TABLE_HTML, unsafe_allow_html=True)
     
     st.markdown("---")
     
@@ -305,37 +350,7 @@ def main():
     st.header("🧠 STRATEGY METHODOLOGY")
     st.subheader("Proprietary Algorithmic Framework")
     
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        st.markdown("""
-        <div class="feature-card">
-            <h4>🧠 Advanced Pattern Recognition</h4>
-            <p>Machine learning algorithms analyze historical market patterns and identify optimal options trading opportunities with precision timing.</p>
-        </div>
-        """, unsafe_allow_html=True)
-        
-        st.markdown("""
-        <div class="feature-card">
-            <h4>🛡️ Options Hedging Protection</h4>
-            <p>Strategic options positions create natural hedges against market volatility, protecting capital during adverse movements while capturing upside potential.</p>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col2:
-        st.markdown("""
-        <div class="feature-card">
-            <h4>⚙️ Systematic Execution</h4>
-            <p>Fully automated options strategy eliminates emotional bias and ensures consistent implementation of complex hedged positions.</p>
-        </div>
-        """, unsafe_allow_html=True)
-        
-        st.markdown("""
-        <div class="feature-card">
-            <h4>📊 Multi-Index Options Selection</h4>
-            <p>Intelligent selection across Nifty and Sensex options with correlation-based hedging for enhanced risk-adjusted returns.</p>
-        </div>
-        """, unsafe_allow_html=True)
+    st.markdown(FEATURE_CARDS_HTML, unsafe_allow_html=True)
     
     # Hedging Advantages
     st.subheader("🛡️ HEDGING STRATEGY ADVANTAGES")
@@ -349,8 +364,7 @@ def main():
         "Time Decay Management: Strategic use of options time decay to enhance returns while maintaining protection"
     ]
     
-    for advantage in advantages:
-        st.write(f"✅ {advantage}")
+    st.markdown("\n\n".join(f"✅ {advantage}" for advantage in advantages))
     
     st.markdown("---")
     
@@ -358,65 +372,12 @@ def main():
     st.header("🛡️ OPTIONS HEDGING & RISK CONTROLS")
     st.subheader("Multi-layered protection through strategic hedging")
     
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        drawdown_fig = create_drawdown_chart()
-        st.plotly_chart(drawdown_fig, use_container_width=True)
-    
-    with col2:
-        radar_fig = create_risk_radar_chart()
-        st.plotly_chart(radar_fig, use_container_width=True)
+    _risk_charts_section()
     
     # Risk Controls
     st.subheader("Risk Control Framework")
     
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        st.markdown("""
-        <div class="feature-card">
-            <h5>Options Hedging Protection</h5>
-            <p>Strategic options positions provide natural insurance against adverse market movements</p>
-        </div>
-        """, unsafe_allow_html=True)
-        
-        st.markdown("""
-        <div class="feature-card">
-            <h5>Volatility Shield</h5>
-            <p>Hedged positions benefit from volatility spikes while limiting downside exposure</p>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col2:
-        st.markdown("""
-        <div class="feature-card">
-            <h5>Dynamic Delta Management</h5>
-            <p>Real-time adjustment of position delta to maintain optimal risk-reward profile</p>
-        </div>
-        """, unsafe_allow_html=True)
-        
-        st.markdown("""
-        <div class="feature-card">
-            <h5>Time Decay Optimization</h5>
-            <p>Strategic use of options theta decay to generate income while maintaining protection</p>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col3:
-        st.markdown("""
-        <div class="feature-card">
-            <h5>Correlation Hedging</h5>
-            <p>Multi-index options selection reduces single-market dependency through diversification</p>
-        </div>
-        """, unsafe_allow_html=True)
-        
-        st.markdown("""
-        <div class="feature-card">
-            <h5>Tail Risk Protection</h5>
-            <p>Options structure provides asymmetric payoff protecting against extreme market events</p>
-        </div>
-        """, unsafe_allow_html=True)
+    st.markdown(RISK_CARDS_HTML, unsafe_allow_html=True)
     
     st.markdown("---")
     
@@ -454,57 +415,7 @@ def main():
     """, unsafe_allow_html=True)
     
     # Investment Terms
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        st.markdown("""
-        <div class="feature-card">
-            <h5>🎯 PERFORMANCE TARGETS</h5>
-            <p>
-                Annual Returns: 40-60%<br>
-                Win Rate: 60-65%<br>
-                Max Drawdown: &lt;25%<br>
-                Sharpe Ratio: &gt;3.0
-            </p>
-        </div>
-        """, unsafe_allow_html=True)
-        
-        st.markdown("""
-        <div class="feature-card">
-            <h5>💼 INVESTMENT TERMS</h5>
-            <p>
-                Minimum Investment: As per discussion<br>
-                Management Fee: Competitive rates<br>
-                Performance Fee: Success aligned<br>
-                Scalable structure
-            </p>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col2:
-        st.markdown("""
-        <div class="feature-card">
-            <h5>📊 OPERATIONAL EXCELLENCE</h5>
-            <p>
-                Daily monitoring & execution<br>
-                Real-time risk management<br>
-                Monthly performance reporting<br>
-                Quarterly optimization reviews
-            </p>
-        </div>
-        """, unsafe_allow_html=True)
-        
-        st.markdown("""
-        <div class="feature-card">
-            <h5>🚀 COMPETITIVE EDGE</h5>
-            <p>
-                Proprietary & proven algorithm<br>
-                Fully systematic execution<br>
-                Various allocation sizes<br>
-                Continuous optimization
-            </p>
-        </div>
-        """, unsafe_allow_html=True)
+    st.markdown(TERMS_CARDS_HTML, unsafe_allow_html=True)
     
     # Footer
     st.markdown("""